@@ -7,12 +7,35 @@ Animação de partículas caindo em buraco negro
 usando integração de geodésicas.
 """
 
+import functools
+import os
+import subprocess
+import tempfile
+
 import numpy as np
+import matplotlib as mpl
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, PillowWriter
+from matplotlib.animation import FFMpegWriter, FuncAnimation, PillowWriter
+from matplotlib.collections import LineCollection
 from matplotlib.patches import Circle
 import matplotlib.colors as mcolors
 
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba é opcional: sem ele as funções abaixo rodam em Python puro
+    prange = range
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda funcao: funcao
+
+try:
+    from numba import cuda
+except ImportError:
+    cuda = None
+
 # ============================================================
 # CONSTANTES
 # ============================================================
@@ -22,9 +45,119 @@ c = 299792458.0
 c2 = c * c
 M_SOL = 1.98892e30
 
+@functools.lru_cache(maxsize=None)
 def raio_schwarzschild(massa_solar):
     return 2.0 * G * massa_solar * M_SOL / c2
 
+# ============================================================
+# NÚCLEO NUMÉRICO (Numba)
+# ============================================================
+
+@njit(cache=True, fastmath=True)
+def _derivadas(r, u_t, u_r, u_phi, rs):
+    """Derivadas de [r, phi, u_t, u_r, u_phi] em escalares (tupla, sem alocar arrays)."""
+    if r <= rs * 1.001:
+        return 0.0, 0.0, 0.0, 0.0, 0.0
+    
+    # Prefatores comuns dos símbolos de Christoffel (duas divisões)
+    rm = r - rs
+    inv_r = 1.0 / r
+    inv_rm = 1.0 / rm
+    a = 0.5 * rs * inv_r * inv_r * inv_r  # Γ^r_tt / (r - rs)
+    b = 0.5 * rs * inv_r * inv_rm         # -Γ^r_rr
+    
+    du_t = -2.0 * b * u_t * u_r
+    du_r = -a * rm * u_t * u_t + b * u_r * u_r + rm * u_phi * u_phi
+    du_phi = -2.0 * inv_r * u_r * u_phi
+    
+    return u_r, u_phi, du_t, du_r, du_phi
+
+@njit(cache=True, fastmath=True)
+def _integrar_geodesica_em(rs, r0, phi0, v_r0, L, num_passos, h, traj):
+    """Laço RK4 completo escrito em `traj` (num_passos+1, 5); retorna n."""
+    # Condições iniciais
+    r = r0
+    phi = phi0
+    u_t = 1.0 / (1.0 - rs / r0)  # Energia = 1
+    u_r = v_r0
+    u_phi = L / (r0**2)
+    
+    traj[0, 0] = r
+    traj[0, 1] = phi
+    traj[0, 2] = u_t
+    traj[0, 3] = u_r
+    traj[0, 4] = u_phi
+    n = 1
+    
+    # Limites de parada: horizonte e escape
+    r_horizonte = rs * 1.001
+    r_escape = r0 * 10.0
+    
+    for _ in range(num_passos):
+        k1 = _derivadas(r, u_t, u_r, u_phi, rs)
+        k2 = _derivadas(r + 0.5 * h * k1[0], u_t + 0.5 * h * k1[2],
+                        u_r + 0.5 * h * k1[3], u_phi + 0.5 * h * k1[4], rs)
+        k3 = _derivadas(r + 0.5 * h * k2[0], u_t + 0.5 * h * k2[2],
+                        u_r + 0.5 * h * k2[3], u_phi + 0.5 * h * k2[4], rs)
+        k4 = _derivadas(r + h * k3[0], u_t + h * k3[2],
+                        u_r + h * k3[3], u_phi + h * k3[4], rs)
+        
+        r += h * (k1[0] + 2.0 * k2[0] + 2.0 * k3[0] + k4[0]) / 6.0
+        phi += h * (k1[1] + 2.0 * k2[1] + 2.0 * k3[1] + k4[1]) / 6.0
+        u_t += h * (k1[2] + 2.0 * k2[2] + 2.0 * k3[2] + k4[2]) / 6.0
+        u_r += h * (k1[3] + 2.0 * k2[3] + 2.0 * k3[3] + k4[3]) / 6.0
+        u_phi += h * (k1[4] + 2.0 * k2[4] + 2.0 * k3[4] + k4[4]) / 6.0
+        
+        if r <= r_horizonte or r > r_escape:
+            break
+        
+        traj[n, 0] = r
+        traj[n, 1] = phi
+        traj[n, 2] = u_t
+        traj[n, 3] = u_r
+        traj[n, 4] = u_phi
+        n += 1
+    
+    return n
+
+@njit(cache=True, fastmath=True)
+def _integrar_geodesica(rs, r0, phi0, v_r0, L, num_passos, h):
+    """Integra uma partícula; retorna a trajetória (n, 5) já truncada."""
+    traj = np.empty((num_passos + 1, 5))
+    n = _integrar_geodesica_em(rs, r0, phi0, v_r0, L, num_passos, h, traj)
+    return traj[:n]
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _integrar_lote(ci, rs, num_passos, h, trajs, comprimentos):
+    """Integra várias partículas em paralelo; `ci` tem linhas [r0, phi0, v_r0, L]."""
+    for p in prange(ci.shape[0]):
+        comprimentos[p] = _integrar_geodesica_em(rs, ci[p, 0], ci[p, 1], ci[p, 2],
+                                                 ci[p, 3], num_passos, h, trajs[p])
+
+@functools.lru_cache(maxsize=None)
+def _kernel_cuda():
+    """Kernel CUDA do lote (compilado sob demanda, uma única vez)."""
+    @cuda.jit
+    def kernel(ci, rs, num_passos, h, trajs, comprimentos):
+        # Uma thread por partícula; o laço RK4 escalar é o mesmo da CPU
+        p = cuda.grid(1)
+        if p < ci.shape[0]:
+            comprimentos[p] = _integrar_geodesica_em(rs, ci[p, 0], ci[p, 1], ci[p, 2],
+                                                     ci[p, 3], num_passos, h, trajs[p])
+    return kernel
+
+def _integrar_lote_cuda(ci, rs, num_passos, h, trajs, comprimentos, threads=128):
+    """Mesmo contrato de `_integrar_lote`, executado na GPU."""
+    d_ci = cuda.to_device(ci)
+    d_trajs = cuda.device_array(trajs.shape, dtype=trajs.dtype)
+    d_comprimentos = cuda.device_array(comprimentos.shape, dtype=comprimentos.dtype)
+    
+    blocos = (ci.shape[0] + threads - 1) // threads
+    _kernel_cuda()[blocos, threads](d_ci, rs, num_passos, h, d_trajs, d_comprimentos)
+    
+    d_trajs.copy_to_host(trajs)
+    d_comprimentos.copy_to_host(comprimentos)
+
 # ============================================================
 # INTEGRADOR DE GEODÉSICAS
 # ============================================================
@@ -36,6 +169,13 @@ class IntegradorGeodesica:
         self.M = massa_solar * M_SOL
         self.rs = raio_schwarzschild(massa_solar)
         
+        # Buffers de trabalho do RK4 (reutilizados a cada passo)
+        self._k1 = np.empty(5, dtype=np.float64)
+        self._k2 = np.empty(5, dtype=np.float64)
+        self._k3 = np.empty(5, dtype=np.float64)
+        self._k4 = np.empty(5, dtype=np.float64)
+        self._tmp = np.empty(5, dtype=np.float64)
+        
     def christoffel_r_tt(self, r):
         """Símbolo de Christoffel Γ^r_tt."""
         if r <= self.rs:
@@ -56,62 +196,90 @@ class IntegradorGeodesica:
         """Símbolo de Christoffel Γ^φ_rφ."""
         return 1.0 / r
     
-    def derivadas(self, estado):
-        """Calcula derivadas do estado [t, r, phi, u_t, u_r, u_phi]."""
-        t, r, phi, u_t, u_r, u_phi = estado
+    def derivadas(self, estado, out):
+        """Calcula derivadas do estado [r, phi, u_t, u_r, u_phi] em `out`."""
+        r, phi, u_t, u_r, u_phi = estado
         
         if r <= self.rs * 1.001:
-            return np.zeros(6)
-        
-        # Derivadas das coordenadas
-        dt = u_t
-        dr = u_r
-        dphi = u_phi
-        
-        # Derivadas das velocidades (equação geodésica)
-        du_t = -2.0 * (self.rs / (2.0 * r * (r - self.rs))) * u_t * u_r
-        du_r = (-self.christoffel_r_tt(r) * u_t**2 
-                - self.christoffel_r_rr(r) * u_r**2
-                - self.christoffel_r_phi_phi(r) * u_phi**2)
-        du_phi = -2.0 * self.christoffel_phi_r_phi(r) * u_r * u_phi
-        
-        return np.array([dt, dr, dphi, du_t, du_r, du_phi])
+            out.fill(0.0)
+            return out
+        
+        # Derivadas das coordenadas (t não entra na dinâmica e não é integrado)
+        out[0] = u_r
+        out[1] = u_phi
+        
+        # Derivadas das velocidades (equação geodésica), com os símbolos
+        # de Christoffel acima fatorados em prefatores comuns
+        rm = r - self.rs
+        inv_r = 1.0 / r
+        inv_rm = 1.0 / rm
+        a = 0.5 * self.rs * inv_r * inv_r * inv_r  # Γ^r_tt / (r - rs)
+        b = 0.5 * self.rs * inv_r * inv_rm         # -Γ^r_rr
+        
+        out[2] = -2.0 * b * u_t * u_r
+        out[3] = -a * rm * u_t * u_t + b * u_r * u_r + rm * u_phi * u_phi
+        out[4] = -2.0 * inv_r * u_r * u_phi
+        
+        return out
     
     def passo_rk4(self, estado, h):
-        """Passo Runge-Kutta 4ª ordem."""
-        k1 = self.derivadas(estado)
-        k2 = self.derivadas(estado + 0.5 * h * k1)
-        k3 = self.derivadas(estado + 0.5 * h * k2)
-        k4 = self.derivadas(estado + h * k3)
-        
-        return estado + h * (k1 + 2*k2 + 2*k3 + k4) / 6.0
+        """Passo Runge-Kutta 4ª ordem (atualiza `estado` no lugar)."""
+        k1, k2, k3, k4, tmp = self._k1, self._k2, self._k3, self._k4, self._tmp
+        
+        self.derivadas(estado, k1)
+        np.multiply(k1, 0.5 * h, out=tmp)
+        np.add(tmp, estado, out=tmp)
+        self.derivadas(tmp, k2)
+        np.multiply(k2, 0.5 * h, out=tmp)
+        np.add(tmp, estado, out=tmp)
+        self.derivadas(tmp, k3)
+        np.multiply(k3, h, out=tmp)
+        np.add(tmp, estado, out=tmp)
+        self.derivadas(tmp, k4)
+        
+        # estado += h/6 * (k1 + 2 k2 + 2 k3 + k4)
+        np.add(k2, k3, out=tmp)
+        tmp *= 2.0
+        tmp += k1
+        tmp += k4
+        tmp *= h / 6.0
+        estado += tmp
+        return estado
     
     def integrar(self, r0, phi0, v_r0, L, num_passos=5000, h=0.001):
         """Integra trajetória de partícula massiva."""
-        # Condições iniciais
-        f = 1.0 - self.rs / r0
-        u_t = 1.0 / f  # Energia = 1
-        u_r = v_r0
-        u_phi = L / (r0**2)
+        return _integrar_geodesica(self.rs, r0, phi0, v_r0, L, num_passos, h)
+    
+    def integrar_adaptativo(self, r0, phi0, v_r0, L, t_max=5.0, t_eval=None,
+                            rtol=1e-8, atol=1e-10):
+        """Integra a mesma trajetória com passo adaptativo (DOP853, SciPy)."""
+        from scipy.integrate import solve_ivp
         
-        estado = np.array([0.0, r0, phi0, u_t, u_r, u_phi])
+        rs = self.rs
+        r_horizonte = rs * 1.001
+        r_escape = r0 * 10.0
         
-        trajetoria = [estado.copy()]
+        def rhs(tau, estado):
+            return _derivadas(estado[0], estado[2], estado[3], estado[4], rs)
         
-        for _ in range(num_passos):
-            estado = self.passo_rk4(estado, h)
-            
-            # Verifica horizonte
-            if estado[1] <= self.rs * 1.001:
-                break
-            
-            # Verifica escape
-            if estado[1] > r0 * 10:
-                break
-                
-            trajetoria.append(estado.copy())
+        def horizonte(tau, estado):
+            return estado[0] - r_horizonte
+        horizonte.terminal = True
+        horizonte.direction = -1
         
-        return np.array(trajetoria)
+        def escape(tau, estado):
+            return estado[0] - r_escape
+        escape.terminal = True
+        escape.direction = 1
+        
+        # Condições iniciais
+        u_t = 1.0 / (1.0 - rs / r0)  # Energia = 1
+        estado = np.array([r0, phi0, u_t, v_r0, L / (r0**2)])
+        
+        sol = solve_ivp(rhs, (0.0, t_max), estado, method='DOP853',
+                        t_eval=t_eval, events=[horizonte, escape],
+                        dense_output=False, rtol=rtol, atol=atol)
+        return np.ascontiguousarray(sol.y.T)
 
 # ============================================================
 # ANIMAÇÃO
@@ -120,42 +288,104 @@ class IntegradorGeodesica:
 class AnimacaoBuracoNegro:
     """Animação de partículas caindo no buraco negro."""
     
-    def __init__(self, massa_solar=10.0, num_particulas=8):
+    def __init__(self, massa_solar=10.0, num_particulas=8, semente=42,
+                 backend='cpu'):
+        if backend not in ('cpu', 'cuda'):
+            raise ValueError(f"Backend desconhecido: {backend!r} (use 'cpu' ou 'cuda')")
+        if backend == 'cuda' and (cuda is None or not cuda.is_available()):
+            raise RuntimeError("Backend 'cuda' requer Numba e uma GPU CUDA disponível")
+        
         self.massa_solar = massa_solar
+        self.backend = backend
         self.rs = raio_schwarzschild(massa_solar)
         self.integrador = IntegradorGeodesica(massa_solar)
         self.num_particulas = num_particulas
+        self.rng = np.random.default_rng(semente)
         
         # Cores para partículas
         self.cores = list(mcolors.TABLEAU_COLORS.values())
         
+        # Anéis do disco de acreção (visual), calculados uma única vez
+        self.aneis_disco = self._calcular_aneis_disco()
+        
         # Gerar trajetórias
-        self.trajetorias = []
         self.gerar_trajetorias()
         
+    def _calcular_aneis_disco(self):
+        """Raios e opacidades dos anéis que representam o disco de acreção."""
+        r_mult = np.linspace(3.5, 15, 12)
+        return r_mult * self.rs, 0.1 + 0.03 * (15 - r_mult)
+    
     def gerar_trajetorias(self):
         """Gera trajetórias para todas as partículas."""
         print("Calculando geodésicas...")
         
+        num_passos, h = 3000, 0.001
+        ci = np.empty((self.num_particulas, 4))
+        aleatorios = self.rng.random((self.num_particulas, 2))
+        
         for i in range(self.num_particulas):
             # Condições iniciais variadas
             r0 = self.rs * (5 + i * 2)  # Distâncias diferentes
             phi0 = 2 * np.pi * i / self.num_particulas
-            v_r0 = -0.1 * (0.5 + 0.5 * np.random.random())  # Velocidade radial para dentro
-            L = np.sqrt(self.rs * r0) * (0.8 + 0.4 * np.random.random())  # Momento angular
-            
-            traj = self.integrador.integrar(r0, phi0, v_r0, L, num_passos=3000)
-            self.trajetorias.append(traj)
-            
+            v_r0 = -0.1 * (0.5 + 0.5 * aleatorios[i, 0])  # Velocidade radial para dentro
+            L = np.sqrt(self.rs * r0) * (0.8 + 0.4 * aleatorios[i, 1])  # Momento angular
+            ci[i] = r0, phi0, v_r0, L
+        
+        trajs = np.empty((self.num_particulas, num_passos + 1, 5))
+        comprimentos = np.empty(self.num_particulas, dtype=np.int64)
+        if self.backend == 'cuda':
+            _integrar_lote_cuda(ci, self.rs, num_passos, h, trajs, comprimentos)
+        else:
+            _integrar_lote(ci, self.rs, num_passos, h, trajs, comprimentos)
+        
+        self.trajetorias_lote = trajs
+        self.comprimentos = comprimentos
+        self.trajetorias = [trajs[i, :n] for i, n in enumerate(comprimentos)]
+        self._dados_quadros = None
+        
         print(f"  {len(self.trajetorias)} trajetórias calculadas.")
     
-    def para_cartesianas(self, traj):
-        """Converte trajetória para coordenadas cartesianas."""
-        r = traj[:, 1]
-        phi = traj[:, 2]
-        x = r * np.cos(phi)
-        y = r * np.sin(phi)
-        return x, y
+    def para_cartesianas(self, trajs):
+        """Converte trajetórias (..., 5) para coordenadas cartesianas (..., 2)."""
+        r = trajs[..., 0]
+        phi = trajs[..., 1]
+        xy = np.empty(trajs.shape[:-1] + (2,))
+        np.cos(phi, out=xy[..., 0])
+        xy[..., 0] *= r
+        np.sin(phi, out=xy[..., 1])
+        xy[..., 1] *= r
+        return xy
+    
+    def _preparar_dados_quadros(self):
+        """Dados dos quadros, calculados uma vez e compartilhados entre animações."""
+        if self._dados_quadros is not None:
+            return self._dados_quadros
+        
+        trajs = self.trajetorias_lote
+        comprimentos = self.comprimentos
+        
+        # Posições: (P, Nmax, 2) contíguo em float32 (a integração segue em
+        # float64). Cada trajetória é completada no próprio buffer repetindo
+        # seu último ponto válido, que é então truncado em Nmax
+        n_max = int(comprimentos.max())
+        for i, n in enumerate(comprimentos):
+            trajs[i, n:n_max] = trajs[i, n - 1]
+        xy = self.para_cartesianas(trajs[:, :n_max])
+        xy = np.ascontiguousarray(xy.astype(np.float32, copy=False))
+        
+        # Índice proporcional e início do rastro (últimos N pontos) por quadro
+        indices = np.minimum(np.arange(n_max)[:, None], comprimentos - 1)
+        inicios = np.maximum(0, indices - 100)
+        
+        self._dados_quadros = {
+            'xy': xy,
+            'indices': indices,
+            'inicios': inicios,
+            'cores': [self.cores[i % len(self.cores)]
+                      for i in range(self.num_particulas)],
+        }
+        return self._dados_quadros
     
     def criar_animacao(self, fps=30, duracao=10):
         """Cria animação."""
@@ -163,6 +393,12 @@ class AnimacaoBuracoNegro:
         fig.patch.set_facecolor('black')
         ax.set_facecolor('black')
         
+        anim = self._construir_animacao(fig, ax, self._preparar_dados_quadros(),
+                                        fps, duracao)
+        return anim, fig
+    
+    def _construir_animacao(self, fig, ax, dados, fps, duracao):
+        """Monta a cena e a FuncAnimation em `fig`/`ax` a partir dos dados dos quadros."""
         # Limites
         limite = 30 * self.rs
         ax.set_xlim([-limite, limite])
@@ -184,9 +420,11 @@ class AnimacaoBuracoNegro:
         ax.add_patch(isco)
         
         # Disco de acreção (visual)
-        for r_mult in np.linspace(3.5, 15, 12):
-            disco = Circle((0, 0), r_mult * self.rs, fill=False,
-                          color='orange', alpha=0.1 + 0.03 * (15 - r_mult), 
+        # (patches não podem ser compartilhados entre figuras; só a
+        # geometria é reaproveitada)
+        for raio, alpha in zip(*self.aneis_disco):
+            disco = Circle((0, 0), raio, fill=False,
+                          color='orange', alpha=alpha, 
                           linewidth=5, zorder=1)
             ax.add_patch(disco)
         
@@ -197,48 +435,41 @@ class AnimacaoBuracoNegro:
         
         titulo = ax.set_title('', color='white', fontsize=14, pad=20)
         
-        # Linhas de trajetória (rastro)
-        linhas = []
-        pontos = []
-        
-        for i, traj in enumerate(self.trajetorias):
-            cor = self.cores[i % len(self.cores)]
-            linha, = ax.plot([], [], color=cor, alpha=0.4, linewidth=1)
-            ponto, = ax.plot([], [], 'o', color=cor, markersize=8)
-            linhas.append(linha)
-            pontos.append(ponto)
-        
         # Prepara dados
-        trajs_xy = [self.para_cartesianas(t) for t in self.trajetorias]
-        max_frames = max(len(t) for t in self.trajetorias)
+        xy = dados['xy']
+        indices = dados['indices']
+        inicios = dados['inicios']
+        cores = dados['cores']
+        max_frames = xy.shape[1]
         num_frames = min(max_frames, fps * duracao)
+        particulas = np.arange(self.num_particulas)
+        
+        # Rastros e partículas: uma coleção de cada (um desenho por quadro)
+        rastros = LineCollection([], colors=cores, alpha=0.4, linewidths=1,
+                                 zorder=2)
+        ax.add_collection(rastros)
+        pontos = ax.scatter(xy[:, 0, 0], xy[:, 0, 1], color=cores, s=64,
+                            linewidths=1, zorder=2)
         
         def init():
-            for linha, ponto in zip(linhas, pontos):
-                linha.set_data([], [])
-                ponto.set_data([], [])
+            rastros.set_segments([])
+            pontos.set_offsets(np.empty((0, 2)))
             titulo.set_text('')
-            return linhas + pontos + [titulo]
+            return [rastros, pontos, titulo]
         
         def animate(frame):
             tempo = frame / fps
             titulo.set_text(f'Buraco Negro {self.massa_solar:.0f} M☉  |  t = {tempo:.2f} s')
             
-            for i, (linha, ponto, (x, y)) in enumerate(zip(linhas, pontos, trajs_xy)):
-                # Índice proporcional
-                idx = min(frame, len(x) - 1)
-                
-                # Rastro (últimos N pontos)
-                inicio = max(0, idx - 100)
-                linha.set_data(x[inicio:idx+1], y[inicio:idx+1])
-                
-                # Posição atual
-                if idx < len(x):
-                    ponto.set_data([x[idx]], [y[idx]])
-                else:
-                    ponto.set_data([], [])
+            idx = indices[frame]
+            inicio = inicios[frame]
+            
+            rastros.set_segments([xy[i, inicio[i]:idx[i] + 1] for i in particulas])
             
-            return linhas + pontos + [titulo]
+            # Posição atual
+            pontos.set_offsets(xy[particulas, idx])
+            
+            return [rastros, pontos, titulo]
         
         # Cria animação
         print("Gerando animação...")
@@ -251,16 +482,42 @@ class AnimacaoBuracoNegro:
         
         ax.grid(True, alpha=0.1, color='gray')
         
-        return anim, fig
+        return anim
     
-    def salvar_gif(self, caminho, fps=30, duracao=10):
-        """Salva animação como GIF."""
+    def _gravar(self, caminho, writer, fps, duracao):
+        """Renderiza a animação e grava em arquivo com o writer dado."""
         anim, fig = self.criar_animacao(fps, duracao)
-        
-        print(f"Salvando GIF em {caminho}...")
-        writer = PillowWriter(fps=fps)
         anim.save(caminho, writer=writer, dpi=100)
         plt.close(fig)
+    
+    def salvar_video(self, caminho, fps=30, duracao=10):
+        """Salva animação como vídeo MP4 (FFmpeg)."""
+        print(f"Salvando vídeo em {caminho}...")
+        writer = FFMpegWriter(fps=fps, codec='libx264', bitrate=2000)
+        self._gravar(caminho, writer, fps, duracao)
+        
+        print(f"✓ Animação salva: {caminho}")
+    
+    def salvar_gif(self, caminho, fps=30, duracao=10):
+        """Salva animação como GIF.
+        
+        Com FFmpeg disponível, codifica um MP4 temporário e o converte com
+        paleta otimizada (palettegen/paletteuse); caso contrário usa o
+        PillowWriter do Matplotlib.
+        """
+        print(f"Salvando GIF em {caminho}...")
+        
+        if not FFMpegWriter.isAvailable():
+            self._gravar(caminho, PillowWriter(fps=fps), fps, duracao)
+        else:
+            with tempfile.TemporaryDirectory() as pasta:
+                video = os.path.join(pasta, 'animacao.mp4')
+                writer = FFMpegWriter(fps=fps, codec='libx264', bitrate=2000)
+                self._gravar(video, writer, fps, duracao)
+                subprocess.run([mpl.rcParams['animation.ffmpeg_path'],
+                                '-y', '-loglevel', 'error', '-i', video,
+                                '-vf', 'split[a][b];[a]palettegen[p];[b][p]paletteuse',
+                                caminho], check=True)
         
         print(f"✓ Animação salva: {caminho}")
     
@@ -283,8 +540,11 @@ def main():
     # Criar animação
     anim = AnimacaoBuracoNegro(massa_solar=10.0, num_particulas=6)
     
-    # Salvar como GIF
-    anim.salvar_gif('../saida/geodesicas.gif', fps=30, duracao=8)
+    # Salvar como MP4 (FFmpeg) ou, sem FFmpeg, como GIF
+    if FFMpegWriter.isAvailable():
+        anim.salvar_video('../saida/geodesicas.mp4', fps=30, duracao=8)
+    else:
+        anim.salvar_gif('../saida/geodesicas.gif', fps=30, duracao=8)
     
     # Mostrar interativamente
     print("\nAbrindo animação interativa...")
@@ -14,6 +14,15 @@ from matplotlib import cm
 from matplotlib.patches import Circle
 import mpl_toolkits.mplot3d.art3d as art3d
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba é opcional: sem ele as funções abaixo rodam em Python puro
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda funcao: funcao
+
 # ============================================================
 # CONSTANTES FÍSICAS
 # ============================================================
@@ -28,6 +37,86 @@ def raio_schwarzschild(massa_solar):
     M = massa_solar * M_SOL
     return 2.0 * G * M / c2
 
+# ============================================================
+# NÚCLEO NUMÉRICO
+# ============================================================
+
+@njit(cache=True)
+def _geodesica_newtoniana(rs, GM, r0, phi0, theta0, num_pontos, dt):
+    """Integração Newtoniana (Euler); retorna os pontos (n, 3) em cartesianas."""
+    r = r0
+    phi = phi0
+    sen_theta = np.sin(theta0)
+    cos_theta = np.cos(theta0)
+    
+    # Velocidade inicial (circular aproximada)
+    v_phi = np.sqrt(GM / r0) / r0
+    v_r = 0.0
+    
+    trajetoria = np.empty((num_pontos, 3))
+    
+    for i in range(num_pontos):
+        trajetoria[i, 0] = r * sen_theta * np.cos(phi)
+        trajetoria[i, 1] = r * sen_theta * np.sin(phi)
+        trajetoria[i, 2] = r * cos_theta
+        
+        # Força gravitacional (Newtoniano para visualização)
+        if r <= rs * 1.01:
+            return trajetoria[:i + 1]
+        a_r = -GM / (r * r)
+        
+        # Integração
+        v_r += a_r * dt
+        r += v_r * dt
+        phi += v_phi * dt
+        
+        if r < rs * 1.01:
+            return trajetoria[:i + 1]
+    
+    return trajetoria
+
+def _geodesicas_newtonianas(rs, GM, r0, phi0, theta0, num_pontos, dt):
+    """Mesma integração para várias partículas de uma vez (NumPy).
+    
+    Retorna o histórico (num_pontos, P, 3) e o número de pontos válidos
+    de cada partícula.
+    """
+    r = np.array(r0, dtype=np.float64)
+    phi = np.array(phi0, dtype=np.float64)
+    sen_theta = np.sin(theta0)
+    cos_theta = np.cos(theta0)
+    
+    # Velocidade inicial (circular aproximada)
+    v_phi = np.sqrt(GM / r) / r
+    v_r = np.zeros_like(r)
+    
+    historico = np.empty((num_pontos, r.size, 3))
+    comprimentos = np.zeros(r.size, dtype=np.int64)
+    ativo = np.ones(r.size, dtype=bool)
+    limite = rs * 1.01
+    
+    for i in range(num_pontos):
+        historico[i, :, 0] = r * sen_theta * np.cos(phi)
+        historico[i, :, 1] = r * sen_theta * np.sin(phi)
+        historico[i, :, 2] = r * cos_theta
+        comprimentos[ativo] = i + 1
+        
+        # Partículas que atingiram o horizonte param de ser integradas
+        ativo &= r > limite
+        if not ativo.any():
+            break
+        
+        # Integração
+        v_r[ativo] -= GM / (r[ativo] * r[ativo]) * dt
+        r[ativo] += v_r[ativo] * dt
+        phi[ativo] += v_phi[ativo] * dt
+        
+        ativo &= r >= limite
+        if not ativo.any():
+            break
+    
+    return historico, comprimentos
+
 # ============================================================
 # VISUALIZADOR 3D
 # ============================================================
@@ -46,13 +135,17 @@ class VisualizadorBuracoNegro:
         self.cor_disco = cm.hot
         self.cor_geodesica = 'cyan'
         
+        # Polígonos do disco de acreção (calculados no primeiro desenho)
+        self._poligonos_disco = None
+        
     def criar_esfera(self, raio, resolucao=50):
         """Cria malha de esfera."""
         u = np.linspace(0, 2 * np.pi, resolucao)
         v = np.linspace(0, np.pi, resolucao)
-        x = raio * np.outer(np.cos(u), np.sin(v))
-        y = raio * np.outer(np.sin(u), np.sin(v))
-        z = raio * np.outer(np.ones(np.size(u)), np.cos(v))
+        sen_v = np.sin(v)[None, :]
+        x = raio * np.cos(u)[:, None] * sen_v
+        y = raio * np.sin(u)[:, None] * sen_v
+        z = np.broadcast_to(raio * np.cos(v)[None, :], x.shape)
         return x, y, z
         
     def criar_disco(self, raio_interno, raio_externo, resolucao=100):
@@ -68,13 +161,13 @@ class VisualizadorBuracoNegro:
     def temperatura_disco(self, r):
         """Perfil de temperatura Shakura-Sunyaev simplificado."""
         r_isco = 3.0 * self.rs
-        if np.any(r < r_isco):
-            r = np.maximum(r, r_isco)
+        r = np.maximum(r, r_isco)
         
         # T ∝ r^(-3/4) × [1 - (r_in/r)^(1/2)]^(1/4)
-        x = r / r_isco
+        x = r * (1.0 / r_isco)
+        inv_sqrt_x = 1.0 / np.sqrt(x)
         T_max = 1e7  # Kelvin (exemplo)
-        T = T_max * np.power(x, -0.75) * np.power(1.0 - np.sqrt(1.0 / x), 0.25)
+        T = T_max * x**(-0.75) * (1.0 - inv_sqrt_x)**0.25
         return T
     
     def desenhar_horizonte(self, ax, alpha=1.0):
@@ -88,57 +181,61 @@ class VisualizadorBuracoNegro:
         x, y, z = self.criar_esfera(r_fotons)
         ax.plot_surface(x, y, z, color='yellow', alpha=alpha, shade=False)
         
-    def desenhar_disco_acrecao(self, ax, alpha=0.8):
-        """Desenha o disco de acreção com mapa de temperatura."""
+    def calcular_poligonos_disco(self, max_faces=50):
+        """Quadriláteros (n, 4, 3) e cores RGBA (n, 4) do disco de acreção."""
         r_isco = 3.0 * self.rs
         r_externo = 15.0 * self.rs
         
         x, y, z, r = self.criar_disco(r_isco, r_externo)
         T = self.temperatura_disco(r)
         T_norm = (T - T.min()) / (T.max() - T.min())
+        cores = self.cor_disco(T_norm)
         
-        ax.plot_surface(x, y, z, facecolors=self.cor_disco(T_norm), 
-                       alpha=alpha, shade=False, linewidth=0)
+        # Mesma amostragem do plot_surface: até max_faces faces por direção,
+        # incluindo as duas bordas
+        def amostrar(n):
+            passo = max(int(np.ceil(n / max_faces)), 1)
+            return np.r_[np.arange(0, n - 1, passo), n - 1]
+        
+        linhas = amostrar(x.shape[0])
+        colunas = amostrar(x.shape[1])
+        malha = np.stack([x, y, z], axis=-1)[np.ix_(linhas, colunas)]
+        
+        verts = np.stack([malha[:-1, :-1], malha[1:, :-1],
+                          malha[1:, 1:], malha[:-1, 1:]], axis=2).reshape(-1, 4, 3)
+        cores = cores[np.ix_(linhas[:-1], colunas[:-1])].reshape(-1, 4)
+        return verts, cores
+    
+    def desenhar_disco_acrecao(self, ax, alpha=0.8):
+        """Desenha o disco de acreção com mapa de temperatura."""
+        if self._poligonos_disco is None:
+            self._poligonos_disco = self.calcular_poligonos_disco()
+        verts, cores = self._poligonos_disco
+        
+        disco = art3d.Poly3DCollection(verts, facecolors=cores, edgecolors=cores,
+                                       alpha=alpha, linewidths=0)
+        ax.add_collection3d(disco)
     
     def desenhar_geodesica(self, ax, r0, phi0, theta0=np.pi/2, 
                            num_pontos=500, tipo='massiva'):
         """Desenha uma geodésica (trajetória de partícula)."""
         # Integração simplificada de geodésica
-        dt = 0.1
-        r = r0
-        phi = phi0
-        theta = theta0
-        
-        # Velocidade inicial (circular aproximada)
-        v_phi = np.sqrt(G * self.massa_solar * M_SOL / r0) / r0
-        v_r = 0.0
-        
-        trajetoria = []
-        
-        for _ in range(num_pontos):
-            x = r * np.sin(theta) * np.cos(phi)
-            y = r * np.sin(theta) * np.sin(phi)
-            z = r * np.cos(theta)
-            trajetoria.append([x, y, z])
-            
-            # Força gravitacional (Newtoniano para visualização)
-            if r > self.rs * 1.01:
-                a_r = -G * self.massa_solar * M_SOL / (r * r)
-            else:
-                break
-            
-            # Integração
-            v_r += a_r * dt
-            r += v_r * dt
-            phi += v_phi * dt
-            
-            if r < self.rs * 1.01:
-                break
-        
-        trajetoria = np.array(trajetoria)
+        GM = G * self.massa_solar * M_SOL
+        trajetoria = _geodesica_newtoniana(self.rs, GM, r0, phi0, theta0,
+                                           num_pontos, 0.1)
         ax.plot3D(trajetoria[:, 0], trajetoria[:, 1], trajetoria[:, 2],
                   color=self.cor_geodesica, linewidth=1.5, alpha=0.8)
     
+    def desenhar_geodesicas(self, ax, r0, phi0, theta0=np.pi/2, num_pontos=500):
+        """Desenha várias geodésicas integradas juntas (r0 e phi0 são arrays)."""
+        GM = G * self.massa_solar * M_SOL
+        historico, comprimentos = _geodesicas_newtonianas(
+            self.rs, GM, r0, phi0, theta0, num_pontos, 0.1)
+        
+        for k, n in enumerate(comprimentos):
+            ax.plot3D(historico[:n, k, 0], historico[:n, k, 1], historico[:n, k, 2],
+                      color=self.cor_geodesica, linewidth=1.5, alpha=0.8)
+    
     def visualizar(self, mostrar_disco=True, mostrar_geodesicas=True,
                    mostrar_esfera_fotons=True, elevation=30, azimuth=45):
         """Cria visualização 3D completa."""
@@ -162,9 +259,9 @@ class VisualizadorBuracoNegro:
             
         if mostrar_geodesicas:
             # Várias geodésicas em diferentes órbitas
-            for r_mult in [5, 7, 10, 12]:
-                for phi_inicio in [0, np.pi/2, np.pi, 3*np.pi/2]:
-                    self.desenhar_geodesica(ax, r_mult * self.rs, phi_inicio)
+            r0 = np.repeat([5, 7, 10, 12], 4) * self.rs
+            phi0 = np.tile([0, np.pi/2, np.pi, 3*np.pi/2], 4)
+            self.desenhar_geodesicas(ax, r0, phi0)
         
         # Configurações visuais
         ax.set_facecolor('black')
@@ -215,14 +312,15 @@ def plotar_potencial_efetivo(massa_solar=10.0, L_valores=None):
     fig.patch.set_facecolor('#1a1a2e')
     ax.set_facecolor('#16213e')
     
-    for L in L_valores:
-        L_real = L * rs * c  # Momento angular real
-        
-        # Potencial efetivo: V²_eff = (1 - rs/r)(1 + L²/(r²c²))
-        V_eff_sq = (1.0 - rs/r) * (1.0 + L_real**2 / (r**2 * c2))
-        V_eff = np.sqrt(np.maximum(V_eff_sq, 0))
-        
-        ax.plot(r/rs, V_eff, label=f'L = {L:.1f} rs·c', linewidth=2)
+    # Potencial efetivo: V²_eff = (1 - rs/r)(1 + L²/(r²c²)), uma linha por L
+    f = 1.0 - rs / r
+    L_real = np.asarray(L_valores, dtype=np.float64)[:, None] * rs * c  # Momento angular real
+    V_eff_sq = f * (1.0 + (L_real * L_real) / (r * r * c2))
+    V_eff = np.sqrt(np.maximum(V_eff_sq, 0.0))
+    
+    r_norm = r / rs
+    for L, V in zip(L_valores, V_eff):
+        ax.plot(r_norm, V, label=f'L = {L:.1f} rs·c', linewidth=2)
     
     # Linhas de referência
     ax.axvline(x=1.0, color='red', linestyle='--', alpha=0.5, 